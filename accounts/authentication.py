@@ -0,0 +1,49 @@
+"""
+JWT authentication with a cache-backed token blacklist.
+Revoked token ids are kept in the cache until the token would expire anyway.
+"""
+from django.core.cache import cache
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import aware_utcnow, datetime_to_epoch
+
+
+def blacklist_cache_key(jti):
+    """Cache key marking a token id as revoked."""
+    return f"bl:{jti}"
+
+
+def blacklist_token(token):
+    """
+    Revoke a token for the rest of its lifetime.
+    Returns False if it was already revoked; the check is atomic, so only
+    one of several concurrent callers gets True.
+    """
+    timeout = token['exp'] - datetime_to_epoch(aware_utcnow())
+    if timeout <= 0:
+        # Already expired, nothing left to revoke
+        return True
+    return cache.add(blacklist_cache_key(token[api_settings.JTI_CLAIM]), 1, timeout)
+
+
+def is_token_blacklisted(token):
+    """Check whether a token has been revoked."""
+    return cache.has_key(blacklist_cache_key(token[api_settings.JTI_CLAIM]))
+
+
+async def ais_token_blacklisted(token):
+    """Async version of is_token_blacklisted, for use on the event loop."""
+    return await cache.ahas_key(blacklist_cache_key(token[api_settings.JTI_CLAIM]))
+
+
+class CachedBlacklistJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that also rejects tokens revoked on logout.
+    """
+
+    def get_validated_token(self, raw_token):
+        validated_token = super().get_validated_token(raw_token)
+        if is_token_blacklisted(validated_token):
+            raise InvalidToken('Token is blacklisted')
+        return validated_token
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.14 on 2026-10-15 09:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='role',
+            field=models.CharField(choices=[('MANAGER', 'Manager'), ('WORKER', 'Worker')], db_index=True, default='WORKER', help_text='User role determines access level in the system', max_length=20),
+        ),
+    ]
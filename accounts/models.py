@@ -17,6 +17,7 @@ class User(AbstractUser):
         max_length=20,
         choices=ROLE_CHOICES,
         default='WORKER',
+        db_index=True,
         help_text='User role determines access level in the system'
     )
     phone = models.CharField(max_length=15, blank=True, null=True)
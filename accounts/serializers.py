@@ -1,5 +1,9 @@
 from rest_framework import serializers
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
 from django.contrib.auth import get_user_model
+from .authentication import blacklist_token, is_token_blacklisted
 
 User = get_user_model()
 
@@ -13,6 +17,23 @@ class UserSerializer(serializers.ModelSerializer):
         read_only_fields = ('id', 'created_at')
 
 
+_datetime_field = serializers.DateTimeField()
+
+
+def serialize_user(user):
+    """Build the UserSerializer payload directly, skipping serializer machinery"""
+    return {
+        'id': user.id,
+        'username': user.username,
+        'email': user.email,
+        'first_name': user.first_name,
+        'last_name': user.last_name,
+        'role': user.role,
+        'phone': user.phone,
+        'created_at': _datetime_field.to_representation(user.created_at),
+    }
+
+
 class UserRegistrationSerializer(serializers.ModelSerializer):
     """Serializer for user registration"""
     password = serializers.CharField(write_only=True, required=True, style={'input_type': 'password'})
@@ -40,3 +61,50 @@ class LoginSerializer(serializers.Serializer):
     """Serializer for user login"""
     username = serializers.CharField()
     password = serializers.CharField(style={'input_type': 'password'})
+
+
+class UserTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """Token serializer that embeds user info as claims (read by WebSocket auth)"""
+    
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        token['username'] = user.username
+        token['role'] = user.role
+        return token
+
+
+class BlacklistTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refresh serializer that honours the cache-backed token blacklist.
+    Also re-checks the user on every refresh and re-stamps the claims
+    WebSocket auth reads, so they are at most one access token old.
+    """
+    
+    def validate(self, attrs):
+        refresh = self.token_class(attrs['refresh'])
+        
+        if api_settings.ROTATE_REFRESH_TOKENS and api_settings.BLACKLIST_AFTER_ROTATION:
+            # Rotated refresh tokens can't be reused. Revoking is atomic, so of
+            # two concurrent refreshes with the same token only one succeeds.
+            if not blacklist_token(refresh):
+                raise InvalidToken('Token is blacklisted')
+        elif is_token_blacklisted(refresh):
+            raise InvalidToken('Token is blacklisted')
+        
+        # SimpleJWT's refresh never loads the user; reject deleted or inactive ones
+        user = User.objects.only('id', 'username', 'role', 'is_active').filter(
+            **{api_settings.USER_ID_FIELD: refresh[api_settings.USER_ID_CLAIM]}
+        ).first()
+        if user is None or not user.is_active:
+            raise InvalidToken('User not found or inactive')
+        refresh['username'] = user.username
+        refresh['role'] = user.role
+        
+        data = {'access': str(refresh.access_token)}
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            data['refresh'] = str(refresh)
+        return data
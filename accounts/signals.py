@@ -0,0 +1,17 @@
+"""
+Django signals for invalidating the cached user list when users change.
+"""
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from laser_workshop.cache import bump_version_on_commit
+from .viewsets import USER_LIST_CACHE_PREFIX
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def user_list_changed(sender, instance, **kwargs):
+    """Bump the user list cache version when a user is saved or deleted."""
+    bump_version_on_commit(USER_LIST_CACHE_PREFIX)
@@ -5,10 +5,30 @@ from rest_framework.views import APIView
 from rest_framework.exceptions import AuthenticationFailed, ValidationError
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth import authenticate, get_user_model
-from .serializers import UserSerializer, UserRegistrationSerializer, LoginSerializer
+from django.core.cache import cache
+from django.utils.cache import get_conditional_response
+from django.utils.crypto import salted_hmac
+from django.utils.http import http_date, quote_etag
+from .authentication import blacklist_token
+from .serializers import (
+    UserSerializer,
+    UserRegistrationSerializer,
+    LoginSerializer,
+    UserTokenObtainPairSerializer,
+    serialize_user
+)
 
 User = get_user_model()
 
+# How long a rejected username/password pair is answered from cache
+LOGIN_FAILURE_CACHE_TIMEOUT = 30
+
+
+def login_failure_cache_key(username, password):
+    """Cache key for a rejected credential pair (keyed by an HMAC, never the raw password)"""
+    digest = salted_hmac('accounts.login_failure', f"{username}:{password}").hexdigest()[:16]
+    return f"loginfail:{digest}"
+
 
 class RegisterView(generics.CreateAPIView):
     """
@@ -34,25 +54,30 @@ class LoginView(APIView):
         username = serializer.validated_data['username']
         password = serializer.validated_data['password']
         
+        # Replayed bad credentials skip the DB lookup and password hashing
+        failure_key = login_failure_cache_key(username, password)
+        if cache.get(failure_key):
+            raise AuthenticationFailed('messages.invalidCredentials')
+        
         user = authenticate(username=username, password=password)
         
         if user is not None:
-            refresh = RefreshToken.for_user(user)
-            user_serializer = UserSerializer(user)
+            refresh = UserTokenObtainPairSerializer.get_token(user)
             
             return Response({
                 'refresh': str(refresh),
                 'access': str(refresh.access_token),
-                'user': user_serializer.data
+                'user': serialize_user(user)
             }, status=status.HTTP_200_OK)
         
+        cache.set(failure_key, 1, LOGIN_FAILURE_CACHE_TIMEOUT)
         raise AuthenticationFailed('messages.invalidCredentials')
 
 
 class LogoutView(APIView):
     """
     API endpoint for user logout.
-    Blacklists the refresh token.
+    Blacklists the refresh token and the access token used for the request.
     """
     permission_classes = (IsAuthenticated,)
     
@@ -60,7 +85,8 @@ class LogoutView(APIView):
         try:
             refresh_token = request.data.get("refresh_token")
             token = RefreshToken(refresh_token)
-            token.blacklist()
+            blacklist_token(token)
+            blacklist_token(request.auth)
             return Response(
                 {"message": "Successfully logged out."},
                 status=status.HTTP_200_OK
@@ -72,9 +98,25 @@ class LogoutView(APIView):
 class CurrentUserView(generics.RetrieveAPIView):
     """
     API endpoint to get current authenticated user information.
+    Supports conditional GET (ETag / Last-Modified) based on user.updated_at.
     """
     permission_classes = (IsAuthenticated,)
     serializer_class = UserSerializer
     
     def get_object(self):
         return self.request.user
+    
+    def retrieve(self, request, *args, **kwargs):
+        user = self.get_object()
+        etag = quote_etag(f"{user.pk}-{user.updated_at.timestamp()}")
+        last_modified = int(user.updated_at.timestamp())
+        
+        # 304 when the client's copy is still current
+        not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if not_modified is not None:
+            return not_modified
+        
+        response = Response(serialize_user(user))
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        return response
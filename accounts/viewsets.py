@@ -3,11 +3,20 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from laser_workshop.cache import cache_key
 from .serializers import UserSerializer
 from orders.permissions import IsManager
 
 User = get_user_model()
 
+# Cached lists also expire on their own
+USER_LIST_CACHE_TIMEOUT = 30
+# Cache key prefix, bumped by accounts.signals when users change
+USER_LIST_CACHE_PREFIX = 'users'
+# Query params the user list depends on
+USER_LIST_CACHE_PARAMS = ('page', 'ordering')
+
 
 class UserViewSet(viewsets.ModelViewSet):
     """
@@ -25,4 +34,20 @@ class UserViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         """Only return users, exclude current user from list"""
-        return User.objects.exclude(id=self.request.user.id).order_by('-date_joined')
+        return User.objects.exclude(id=self.request.user.id).only(
+            'id', 'username', 'email', 'first_name', 'last_name', 'role', 'phone',
+            'is_active', 'date_joined', 'created_at', 'updated_at'
+        ).order_by('-date_joined')
+    
+    def list(self, request, *args, **kwargs):
+        """
+        List users, cached per requesting user (they are excluded from it).
+        Any user change bumps the cache version (see accounts.signals).
+        """
+        build = super().list
+        data = cache.get_or_set(
+            f"{cache_key(USER_LIST_CACHE_PREFIX, request, USER_LIST_CACHE_PARAMS)}:{request.user.id}",
+            lambda: build(request, *args, **kwargs).data,
+            USER_LIST_CACHE_TIMEOUT
+        )
+        return Response(data)
@@ -0,0 +1,48 @@
+"""
+Helpers for caching list responses under a version number.
+Bumping the version makes every entry cached under the old one unreachable,
+so invalidation doesn't need to know which pages were cached.
+"""
+import hashlib
+import time
+from django.core.cache import cache
+from django.db import transaction
+
+
+def version_key(prefix):
+    """Cache key holding the current version for a prefix."""
+    return f"{prefix}:version"
+
+
+def get_version(prefix):
+    """Current cache version for a prefix."""
+    return cache.get_or_set(version_key(prefix), int(time.time()), None)
+
+
+def bump_version(prefix):
+    """Invalidate everything cached under a prefix."""
+    try:
+        cache.incr(version_key(prefix))
+    except ValueError:
+        # Version was evicted; restart from a value old entries can't share
+        cache.set(version_key(prefix), int(time.time()), None)
+
+
+def bump_version_on_commit(prefix):
+    """
+    Bump a prefix's version once the current transaction commits,
+    so readers can't re-cache the old rows under the new version.
+    """
+    transaction.on_commit(lambda: bump_version(prefix))
+
+
+def cache_key(prefix, request, params):
+    """
+    Versioned cache key for a request.
+    Only the given query params are part of the key, so unknown params
+    can't bypass the cache or fill it with new entries.
+    """
+    query = hashlib.md5('&'.join(
+        f"{name}={request.query_params.get(name, '')}" for name in params
+    ).encode()).hexdigest()
+    return f"{prefix}:v{get_version(prefix)}:{query}"
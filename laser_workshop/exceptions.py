@@ -22,6 +22,17 @@ def custom_exception_handler(exc, context):
     response = exception_handler(exc, context)
     
     if response is not None:
+        # Fast path for the common {'detail': '...'} errors (401, 403, 404, etc.)
+        if (
+            not isinstance(exc, ValidationError) and
+            isinstance(response.data, dict) and
+            len(response.data) == 1 and
+            response.data.get('detail')
+        ):
+            detail = response.data['detail']
+            response.data = {'message': detail, 'detail': str(detail)}
+            return response
+        
         # Initialize custom response data
         custom_response = {}
         
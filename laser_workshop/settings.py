@@ -70,6 +70,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'orders.broadcast.BroadcastBatchMiddleware',
 ]
 
 ROOT_URLCONF = 'laser_workshop.urls'
@@ -93,7 +94,7 @@ TEMPLATES = [
 WSGI_APPLICATION = 'laser_workshop.wsgi.application'
 ASGI_APPLICATION = 'laser_workshop.asgi.application'
 
-# Channel Layers configuration
+# Channel Layers and cache configuration
 # Use Redis in production, in-memory for development
 if config('USE_REDIS', default=False, cast=bool):
     # Production: Redis-backed channel layer (requires Railway Redis addon)
@@ -102,9 +103,20 @@ if config('USE_REDIS', default=False, cast=bool):
             'BACKEND': 'channels_redis.core.RedisChannelLayer',
             'CONFIG': {
                 "hosts": [config('REDIS_URL', default='redis://localhost:6379')],
+                # Compact binary wire format (channels_redis default, pinned explicitly)
+                "serializer_format": "msgpack",
+                # Per-channel queue size; group_send silently drops messages past it
+                "capacity": 5000,
             },
         },
     }
+    # Shared cache on the same Redis instance
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': config('REDIS_URL', default='redis://localhost:6379'),
+        }
+    }
 else:
     # Development: In-memory channel layer (simpler, no Redis needed)
     CHANNEL_LAYERS = {
@@ -112,6 +124,12 @@ else:
             'BACKEND': 'channels.layers.InMemoryChannelLayer'
         }
     }
+    # Per-process in-memory cache
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
 
 
 
@@ -193,7 +211,7 @@ AUTH_USER_MODEL = 'accounts.User'
 # REST Framework Configuration
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'accounts.authentication.CachedBlacklistJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
@@ -206,6 +224,7 @@ REST_FRAMEWORK = {
         'rest_framework.filters.OrderingFilter',
     ),
     'EXCEPTION_HANDLER': 'laser_workshop.exceptions.custom_exception_handler',
+    'URL_FORMAT_OVERRIDE': None,
 }
 
 # CORS Configuration
@@ -248,6 +267,7 @@ SIMPLE_JWT = {
     'ROTATE_REFRESH_TOKENS': True,
     'BLACKLIST_AFTER_ROTATION': True,
     'AUTH_HEADER_TYPES': ('Bearer',),
+    'TOKEN_REFRESH_SERIALIZER': 'accounts.serializers.BlacklistTokenRefreshSerializer',
 }
 
 
@@ -0,0 +1,119 @@
+"""
+Helpers for broadcasting order and shift changes to WebSocket clients.
+"""
+import threading
+from contextlib import contextmanager
+import orjson
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.db import transaction
+
+# Max order updates carried by one order_bulk_update message
+BROADCAST_BATCH_SIZE = 50
+
+_local = threading.local()
+
+# Channel layer, looked up on the first broadcast rather than at import
+_UNSET = object()
+_channel_layer = _UNSET
+
+
+def encode(event_type, action, key, data):
+    """Serialize a WebSocket message once, before it fans out to every client."""
+    return orjson.dumps({
+        'type': event_type,
+        'action': action,
+        key: data
+    }).decode()
+
+
+def get_orders_channel_layer():
+    """
+    Return the default channel layer, looked up once and reused
+    so signal handlers don't resolve it on every save.
+    """
+    global _channel_layer
+    if _channel_layer is _UNSET:
+        _channel_layer = get_channel_layer()
+    return _channel_layer
+
+
+def group_send(message):
+    """Send a message to the orders group."""
+    channel_layer = get_orders_channel_layer()
+    if channel_layer:
+        async_to_sync(channel_layer.group_send)('orders', message)
+
+
+def broadcast(event_type, action, key, data):
+    """Send a single update to the orders group right away."""
+    group_send({
+        'type': event_type,
+        'payload': encode(event_type, action, key, data)
+    })
+
+
+def send_order_payloads(payloads):
+    """
+    Send serialized order updates to the orders group.
+    A single update goes out as a plain order_update; more are split into
+    order_bulk_update messages of up to BROADCAST_BATCH_SIZE.
+    """
+    if len(payloads) == 1:
+        group_send({'type': 'order_update', 'payload': payloads[0]})
+        return
+    for start in range(0, len(payloads), BROADCAST_BATCH_SIZE):
+        group_send({
+            'type': 'order_bulk_update',
+            'payloads': payloads[start:start + BROADCAST_BATCH_SIZE]
+        })
+
+
+def queue_order_broadcast(action, get_data):
+    """
+    Broadcast an order update once the current transaction commits.
+    Inside batched_order_broadcasts() the update is collected and sent
+    with the others when the block ends.
+    """
+    def send():
+        payload = encode('order_update', action, 'order', get_data())
+        batch = getattr(_local, 'batch', None)
+        if batch is None:
+            send_order_payloads([payload])
+        else:
+            batch.append(payload)
+
+    transaction.on_commit(send)
+
+
+@contextmanager
+def batched_order_broadcasts():
+    """
+    Collect order updates committed inside the block and send them together.
+    Nested blocks join the outermost batch.
+    """
+    if getattr(_local, 'batch', None) is not None:
+        yield
+        return
+
+    _local.batch = []
+    try:
+        yield
+    finally:
+        payloads, _local.batch = _local.batch, None
+        if payloads:
+            send_order_payloads(payloads)
+
+
+class BroadcastBatchMiddleware:
+    """
+    HTTP middleware that sends all order updates committed during a request
+    as one channel layer message instead of one per save.
+    """
+    
+    def __init__(self, get_response):
+        self.get_response = get_response
+    
+    def __call__(self, request):
+        with batched_order_broadcasts():
+            return self.get_response(request)
@@ -1,26 +1,35 @@
 """
 WebSocket consumers for real-time order updates.
 """
-import json
+import asyncio
 import logging
+import orjson
 from channels.generic.websocket import AsyncWebsocketConsumer
-from channels.db import database_sync_to_async
 from django.contrib.auth.models import AnonymousUser
 
 logger = logging.getLogger(__name__)
 
+# Order updates arriving within this window (seconds) share one frame
+ORDER_BATCH_WINDOW = 0.05
+
 
 class OrderConsumer(AsyncWebsocketConsumer):
     """
     WebSocket consumer for broadcasting order updates to connected clients.
     """
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.group_name = None
+        self.pending_orders = []
+        self.flush_task = None
+    
     async def connect(self):
         """Handle WebSocket connection"""
         # Get user from scope (set by AuthMiddlewareStack)
         self.user = self.scope.get('user', AnonymousUser())
         
-        logger.info(f"WebSocket connect attempt - User: {self.user}, Is Anonymous: {self.user.is_anonymous}")
+        logger.debug("WebSocket connect attempt - User: %s, Is Anonymous: %s", self.user, self.user.is_anonymous)
         
         # Reject anonymous users
         if not self.user or self.user.is_anonymous:
@@ -38,20 +47,24 @@ class OrderConsumer(AsyncWebsocketConsumer):
         # Accept the connection
         await self.accept()
         
-        logger.info(f"WebSocket connected successfully for user: {self.user.username}")
+        logger.debug("WebSocket connected successfully for user: %s", self.user.username)
         
         # Send confirmation message
-        await self.send(text_data=json.dumps({
+        await self.send(text_data=orjson.dumps({
             'type': 'connection_established',
             'message': 'Connected to order updates'
-        }))
+        }).decode())
     
     async def disconnect(self, close_code):
         """Handle WebSocket disconnection"""
-        logger.info(f"WebSocket disconnected - Code: {close_code}, User: {getattr(self, 'user', 'Unknown')}")
+        logger.debug("WebSocket disconnected - Code: %s, User: %s", close_code, getattr(self, 'user', 'Unknown'))
+        
+        # Drop updates still waiting for the batch window
+        if self.flush_task:
+            self.flush_task.cancel()
         
         # Leave the orders group
-        if hasattr(self, 'group_name'):
+        if self.group_name:
             await self.channel_layer.group_discard(
                 self.group_name,
                 self.channel_name
@@ -62,27 +75,57 @@ class OrderConsumer(AsyncWebsocketConsumer):
         Receive message from WebSocket.
         For now, we don't process incoming messages from clients.
         """
-        logger.debug(f"WebSocket message received: {text_data}")
+        logger.debug("WebSocket message received: %s", text_data)
         pass
     
     async def order_update(self, event):
         """
-        Receive order update from channel layer and send to WebSocket.
+        Receive order update from channel layer and queue it for the WebSocket.
         This is called when a message is sent to the group.
+        Updates arriving within ORDER_BATCH_WINDOW are sent together.
+        """
+        self.queue_orders([event['payload']])
+    
+    async def order_bulk_update(self, event):
+        """
+        Receive several order updates sent together by the channel layer.
         """
-        # Send message to WebSocket
-        await self.send(text_data=json.dumps({
-            'type': 'order_update',
-            'action': event.get('action'),
-            'order': event.get('order')
-        }))
+        self.queue_orders(event['payloads'])
+    
+    def queue_orders(self, payloads):
+        """Queue order updates and start the batch window if needed."""
+        self.pending_orders.extend(payloads)
+        if self.flush_task is None:
+            self.flush_task = asyncio.create_task(self.flush_orders_later())
+    
+    async def flush_orders_later(self):
+        """Wait for the batch window to close, then flush queued updates."""
+        await asyncio.sleep(ORDER_BATCH_WINDOW)
+        self.flush_task = None
+        await self.flush_orders()
+    
+    async def flush_orders(self):
+        """
+        Send queued order updates to the WebSocket.
+        A single update goes out unchanged; several are wrapped in one
+        {"type": "order_updates_batch", "orders": [<order_update>, ...]} frame.
+        Payloads arrive already serialized by the sender.
+        """
+        payloads, self.pending_orders = self.pending_orders, []
+        if len(payloads) == 1:
+            await self.send(text_data=payloads[0])
+        elif payloads:
+            await self.send(
+                text_data='{"type":"order_updates_batch","orders":[' + ','.join(payloads) + ']}'
+            )
     
     async def shift_update(self, event):
         """
         Receive shift update from channel layer and send to WebSocket.
+        Queued order updates are flushed first to keep events in order.
         """
-        await self.send(text_data=json.dumps({
-            'type': 'shift_update',
-            'action': event.get('action'),
-            'shift': event.get('shift')
-        }))
+        if self.flush_task:
+            self.flush_task.cancel()
+            self.flush_task = None
+        await self.flush_orders()
+        await self.send(text_data=event['payload'])
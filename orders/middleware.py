@@ -5,27 +5,111 @@ import logging
 from channels.middleware import BaseMiddleware
 from channels.db import database_sync_to_async
 from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
 from rest_framework_simplejwt.tokens import AccessToken
 from django.contrib.auth import get_user_model
-from urllib.parse import parse_qs
+from urllib.parse import unquote_plus
+from accounts.authentication import ais_token_blacklisted
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+# Kept well below the access token lifetime
+WS_USER_CACHE_TIMEOUT = 60
+
+
+def ws_user_cache_key(user_id):
+    """Cache key for the user payload used by WebSocket auth."""
+    return f"wsuser:{user_id}"
+
+
+class WebSocketUser:
+    """
+    Lightweight authenticated user attached to WebSocket scopes.
+    Only carries the fields the consumers read, so it can be built
+    from token claims or a cached payload.
+    """
+    is_anonymous = False
+    is_authenticated = True
+
+    def __init__(self, id, username, role, is_active):
+        self.id = self.pk = id
+        self.username = username
+        self.role = role
+        self.is_active = is_active
+
+    def __str__(self):
+        return self.username
+
+
+def _load_user_data(user_id):
+    """Fetch the cached user payload from the database."""
+    user = User.objects.only('id', 'username', 'role', 'is_active').get(id=user_id)
+    return (user.id, user.username, user.role, user.is_active)
+
+
+def get_query_param(query_string, name):
+    """
+    Get the first non-empty value of a query string parameter, or None
+    (same as parse_qs, which drops empty values).
+    Scans for the single parameter instead of parsing the whole string.
+    """
+    query_string = f"&{query_string}"
+    marker = f"&{name}="
+    start = query_string.find(marker)
+    while start != -1:
+        start += len(marker)
+        end = query_string.find('&', start)
+        value = query_string[start:end] if end != -1 else query_string[start:]
+        if value:
+            return unquote_plus(value)
+        start = query_string.find(marker, start)
+    return None
+
 
 @database_sync_to_async
-def get_user_from_token(token_string):
+def get_cached_user(user_id):
+    """
+    Get user by id, caching the payload to skip the DB on repeated handshakes.
+    """
+    return WebSocketUser(*cache.get_or_set(
+        ws_user_cache_key(user_id),
+        lambda: _load_user_data(user_id),
+        WS_USER_CACHE_TIMEOUT
+    ))
+
+
+async def get_user_from_token(token_string):
     """
     Get user from JWT access token.
+    The user is built from the token's claims; tokens issued without
+    them fall back to the cached DB lookup.
+    The claims are re-stamped from the database on every token refresh,
+    which also rejects deleted or inactive users, so a claim-built user
+    is at most one access token lifetime out of date.
     """
     try:
         # Decode and validate token
         access_token = AccessToken(token_string)
+        if await ais_token_blacklisted(access_token):
+            logger.warning("WebSocket auth rejected revoked token")
+            return AnonymousUser()
         user_id = access_token['user_id']
         
-        # Get user from database
-        user = User.objects.get(id=user_id)
-        logger.info(f"WebSocket auth successful for user: {user.username} (ID: {user.id})")
+        if 'username' in access_token and 'role' in access_token:
+            user = WebSocketUser(
+                user_id,
+                access_token['username'],
+                access_token['role'],
+                True
+            )
+        else:
+            user = await get_cached_user(user_id)
+            if not user.is_active:
+                logger.warning("WebSocket auth rejected inactive user ID: %s", user.id)
+                return AnonymousUser()
+        
+        logger.debug("WebSocket auth successful for user: %s (ID: %s)", user.username, user.id)
         return user
     except Exception as e:
         logger.error(f"WebSocket auth error: {type(e).__name__}: {str(e)}")
@@ -41,13 +125,12 @@ class JWTAuthMiddleware(BaseMiddleware):
     async def __call__(self, scope, receive, send):
         # Get query string
         query_string = scope.get('query_string', b'').decode()
-        query_params = parse_qs(query_string)
         
         # Extract token from query params
-        token = query_params.get('token', [None])[0]
+        token = get_query_param(query_string, 'token')
         
         if token:
-            logger.info("WebSocket connection attempt with token")
+            logger.debug("WebSocket connection attempt with token")
             # Get user from token
             scope['user'] = await get_user_from_token(token)
         else:
@@ -0,0 +1,27 @@
+# Generated by Django 5.0.14 on 2026-10-15 09:19
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0003_alter_order_status'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='order',
+            name='orders_orde_status_c6dd84_idx',
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['status', '-created_at'], name='ord_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['delivered_in_shift', 'delivered_at'], name='ord_shift_delivered_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.0.14 on 2026-10-15 09:30
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0004_order_composite_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='order',
+            name='orders_orde_deliver_1355ff_idx',
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['status', 'delivered_at'], name='ord_status_delivered_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(condition=models.Q(('status', 'DELIVERED')), fields=['delivered_at'], name='ord_delivered_partial_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.14 on 2026-10-15 09:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0005_order_delivered_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(condition=models.Q(('image__gt', ''), ('status', 'DELIVERED')), fields=['-delivered_at'], name='showcase_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.14 on 2026-10-15 09:55
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0007_remove_order_shift_delivered_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='order',
+            name='ord_status_delivered_idx',
+        ),
+    ]
@@ -54,6 +54,7 @@ class Order(models.Model):
         ('DONE_CUTTING', 'Done Cutting'),
         ('DELIVERED', 'Delivered'),
     )
+    STATUS_DISPLAY = dict(STATUS_CHOICES)
     
     customer_name = models.CharField(max_length=255)
     customer_phone = models.CharField(max_length=15)
@@ -103,8 +104,17 @@ class Order(models.Model):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['-created_at']),
-            models.Index(fields=['status']),
-            models.Index(fields=['delivered_at']),
+            models.Index(fields=['status', '-created_at'], name='ord_status_created_idx'),
+            models.Index(
+                fields=['delivered_at'],
+                condition=models.Q(status='DELIVERED'),
+                name='ord_delivered_partial_idx'
+            ),
+            models.Index(
+                fields=['-delivered_at'],
+                condition=models.Q(status='DELIVERED', image__gt=''),
+                name='showcase_idx'
+            ),
         ]
     
     def __str__(self):
@@ -123,8 +133,18 @@ class Order(models.Model):
             self.delivered_at = timezone.now()
         
         # Reset delivered_at if status changes from DELIVERED to something else
-        if self.status != 'DELIVERED' and self.delivered_at:
+        # (remembered so signal handlers can tell the order left DELIVERED)
+        self.left_delivered = self.status != 'DELIVERED' and bool(self.delivered_at)
+        if self.left_delivered:
             self.delivered_at = None
         
-        self.full_clean()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None:
+            self.full_clean()
+        else:
+            # Partial updates only need the domain rule, not every field validator
+            self.clean()
+            # delivered_at follows status, so persist it alongside
+            if 'status' in update_fields:
+                kwargs['update_fields'] = {*update_fields, 'delivered_at'}
         super().save(*args, **kwargs)
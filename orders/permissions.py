@@ -1,24 +1,42 @@
 from rest_framework import permissions
 
 
+def _user_role(request):
+    """
+    Role of the authenticated user, or None.
+    Memoized on the request so stacked permission classes check it once.
+    """
+    try:
+        return request._user_role
+    except AttributeError:
+        user = request.user
+        role = user.role if user and user.is_authenticated else None
+        request._user_role = role
+        return role
+
+
+def _is_manager(request):
+    return _user_role(request) == 'MANAGER'
+
+
+def _is_manager_or_worker(request):
+    return _user_role(request) in ('MANAGER', 'WORKER')
+
+
 class IsManager(permissions.BasePermission):
     """
     Custom permission to only allow managers to perform the action.
     """
     def has_permission(self, request, view):
-        return request.user and request.user.is_authenticated and request.user.role == 'MANAGER'
+        return _is_manager(request)
 
 
 class IsManagerOrWorker(permissions.BasePermission):
     """
     Custom permission to allow both managers and workers.
     """
-    def has_permission(request, view):
-        return (
-            request.user and 
-            request.user.is_authenticated and 
-            request.user.role in ['MANAGER', 'WORKER']
-        )
+    def has_permission(self, request, view):
+        return _is_manager_or_worker(request)
 
 
 class CanUpdateOrder(permissions.BasePermission):
@@ -28,11 +46,7 @@ class CanUpdateOrder(permissions.BasePermission):
     - Workers can only update status
     """
     def has_permission(self, request, view):
-        return (
-            request.user and 
-            request.user.is_authenticated and 
-            request.user.role in ['MANAGER', 'WORKER']
-        )
+        return _is_manager_or_worker(request)
     
     def has_object_permission(self, request, view, obj):
         # Read permissions are allowed to any authenticated manager or worker
@@ -40,11 +54,11 @@ class CanUpdateOrder(permissions.BasePermission):
             return True
         
         # Managers can update everything
-        if request.user.role == 'MANAGER':
+        if _is_manager(request):
             return True
         
         # Workers can only update status field
-        if request.user.role == 'WORKER':
+        if _user_role(request) == 'WORKER':
             # Check if only 'status' field is being updated
             if request.method in ['PATCH', 'PUT']:
                 allowed_fields = {'status'}
@@ -60,10 +74,10 @@ class CanDeleteOrder(permissions.BasePermission):
     """
     def has_permission(self, request, view):
         if request.method == 'DELETE':
-            return request.user and request.user.is_authenticated and request.user.role == 'MANAGER'
+            return _is_manager(request)
         return True
     
     def has_object_permission(self, request, view, obj):
         if request.method == 'DELETE':
-            return request.user and request.user.is_authenticated and request.user.role == 'MANAGER'
+            return _is_manager(request)
         return True
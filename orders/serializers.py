@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from django.db.models import Count, Sum
 from django.utils import timezone
 from .models import Order, Shift
 
@@ -30,34 +31,41 @@ class ShiftSerializer(serializers.ModelSerializer):
             delta = timezone.now() - obj.opened_at
         return round(delta.total_seconds() / 3600, 2)
     
+    def _live_stats(self, obj):
+        """
+        Count and revenue of orders delivered since an active shift opened.
+        Fetched in one query and kept on the instance for both fields.
+        """
+        if not hasattr(obj, '_live_stats'):
+            obj._live_stats = Order.objects.filter(
+                status='DELIVERED',
+                delivered_at__gte=obj.opened_at,
+                delivered_at__isnull=False
+            ).aggregate(count=Count('id'), revenue=Sum('price'))
+        return obj._live_stats
+    
     def get_total_orders_delivered(self, obj):
         """Get real-time count of delivered orders in this shift"""
-        from .models import Order
-        from django.db.models import Q
+        # Annotated by ShiftViewSet when listing
+        if hasattr(obj, 'live_orders_delivered'):
+            return obj.live_orders_delivered
         
         if obj.is_active:
             # For active shifts, count orders delivered since shift opened
-            return Order.objects.filter(
-                status='DELIVERED',
-                delivered_at__gte=obj.opened_at,
-                delivered_at__isnull=False
-            ).count()
+            return self._live_stats(obj)['count']
         else:
             # For closed shifts, use stored value
             return obj.total_orders_delivered
     
     def get_total_revenue(self, obj):
         """Get real-time revenue from delivered orders in this shift"""
-        from .models import Order
-        from django.db.models import Sum
+        # Annotated by ShiftViewSet when listing
+        if hasattr(obj, 'live_revenue'):
+            return float(obj.live_revenue)
         
         if obj.is_active:
             # For active shifts, calculate revenue from orders delivered since shift opened
-            revenue = Order.objects.filter(
-                status='DELIVERED',
-                delivered_at__gte=obj.opened_at,
-                delivered_at__isnull=False
-            ).aggregate(Sum('price'))['price__sum']
+            revenue = self._live_stats(obj)['revenue']
             return float(revenue) if revenue else 0.0
         else:
             # For closed shifts, use stored value
@@ -67,7 +75,7 @@ class ShiftSerializer(serializers.ModelSerializer):
 class OrderSerializer(serializers.ModelSerializer):
     """Full serializer for Order model"""
     created_by_username = serializers.CharField(source='created_by.username', read_only=True)
-    status_display = serializers.CharField(source='get_status_display', read_only=True)
+    status_display = serializers.SerializerMethodField()
     
     class Meta:
         model = Order
@@ -78,6 +86,10 @@ class OrderSerializer(serializers.ModelSerializer):
         )
         read_only_fields = ('id', 'created_at', 'updated_at', 'delivered_at', 'created_by')
     
+    def get_status_display(self, obj):
+        """Status label from the precomputed choices dict"""
+        return Order.STATUS_DISPLAY.get(obj.status, obj.status)
+    
     def validate(self, attrs):
         # Validate that price is set when status is DELIVERED
         status = attrs.get('status', self.instance.status if self.instance else None)
@@ -91,6 +103,39 @@ class OrderSerializer(serializers.ModelSerializer):
         return attrs
 
 
+_datetime_field = serializers.DateTimeField()
+_price_field = serializers.DecimalField(max_digits=10, decimal_places=2)
+_image_field = serializers.ImageField()
+
+
+def serialize_order(order):
+    """
+    Build the OrderSerializer payload directly, skipping serializer machinery.
+    Used for WebSocket broadcasts, which fire on every order save.
+    """
+    data = {
+        'id': order.id,
+        'customer_name': order.customer_name,
+        'customer_phone': order.customer_phone,
+        'order_details': order.order_details,
+        'image': _image_field.to_representation(order.image) if order.image else None,
+        'price': _price_field.to_representation(order.price) if order.price is not None else None,
+        'status': order.status,
+        'status_display': Order.STATUS_DISPLAY.get(order.status, order.status),
+        'created_by': order.created_by_id,
+        'created_by_username': None,
+        'created_at': _datetime_field.to_representation(order.created_at),
+        'updated_at': _datetime_field.to_representation(order.updated_at),
+        'delivered_at': _datetime_field.to_representation(order.delivered_at),
+    }
+    # Like OrderSerializer, leave the username out when there is no creator
+    if order.created_by is None:
+        del data['created_by_username']
+    else:
+        data['created_by_username'] = order.created_by.username
+    return data
+
+
 class OrderCreateSerializer(serializers.ModelSerializer):
     """Serializer for creating new orders (workers use this)"""
     
@@ -132,7 +177,7 @@ class OrderUpdateStatusSerializer(serializers.ModelSerializer):
             instance.delivered_at = timezone.now()
         
         instance.status = new_status
-        instance.save()
+        instance.save(update_fields=['status', 'delivered_at', 'updated_at'])
         return instance
 
 
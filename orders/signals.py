@@ -1,29 +1,29 @@
 """
 Django signals for broadcasting order and shift changes via WebSocket.
 """
+from django.core.cache import cache
+from django.db import transaction
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
-from channels.layers import get_channel_layer
-from asgiref.sync import async_to_sync
-from .models import Order, Shift
-from .serializers import OrderSerializer, ShiftSerializer
+from .broadcast import broadcast, queue_order_broadcast
+from .middleware import ws_user_cache_key
+from .models import Order, Shift, User
+from .serializers import ShiftSerializer, serialize_order
 
 
 @receiver(post_save, sender=Order)
 def order_saved(sender, instance, created, **kwargs):
     """
     Broadcast order creation/update to all connected WebSocket clients.
+    Serialization waits for the transaction to commit, so rolled-back
+    saves are never sent and repeated saves in one transaction send the
+    final state. Updates from one request are sent together (see
+    orders.broadcast.BroadcastBatchMiddleware).
     """
-    channel_layer = get_channel_layer()
-    if channel_layer:
-        async_to_sync(channel_layer.group_send)(
-            'orders',
-            {
-                'type': 'order_update',
-                'action': 'created' if created else 'updated',
-                'order': OrderSerializer(instance).data
-            }
-        )
+    queue_order_broadcast(
+        'created' if created else 'updated',
+        lambda: serialize_order(instance)
+    )
 
 
 @receiver(post_delete, sender=Order)
@@ -31,16 +31,9 @@ def order_deleted(sender, instance, **kwargs):
     """
     Broadcast order deletion to all connected WebSocket clients.
     """
-    channel_layer = get_channel_layer()
-    if channel_layer:
-        async_to_sync(channel_layer.group_send)(
-            'orders',
-            {
-                'type': 'order_update',
-                'action': 'deleted',
-                'order': {'id': instance.id}
-            }
-        )
+    # Django clears instance.id after the delete, so capture it now
+    order_id = instance.id
+    queue_order_broadcast('deleted', lambda: {'id': order_id})
 
 
 @receiver(post_save, sender=Shift)
@@ -48,13 +41,16 @@ def shift_saved(sender, instance, created, **kwargs):
     """
     Broadcast shift creation/update to all connected WebSocket clients.
     """
-    channel_layer = get_channel_layer()
-    if channel_layer:
-        async_to_sync(channel_layer.group_send)(
-            'orders',
-            {
-                'type': 'shift_update',
-                'action': 'created' if created else 'updated',
-                'shift': ShiftSerializer(instance).data
-            }
-        )
+    action = 'created' if created else 'updated'
+    transaction.on_commit(
+        lambda: broadcast('shift_update', action, 'shift', ShiftSerializer(instance).data)
+    )
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def user_changed(sender, instance, **kwargs):
+    """
+    Drop the cached WebSocket user so the next handshake reloads it.
+    """
+    cache.delete(ws_user_cache_key(instance.pk))
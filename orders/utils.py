@@ -0,0 +1,24 @@
+"""
+Date range helpers for filtering orders by day or month.
+Half-open [start, end) ranges keep the datetime columns index-friendly,
+unlike __date/__month/__year lookups which wrap the column in a function.
+"""
+from datetime import date, datetime, time, timedelta
+from django.utils import timezone
+
+
+def _start_of_day(day):
+    """Aware datetime for midnight of the given date in the current time zone."""
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def day_range(day):
+    """Return the (start, end) datetimes covering a single day."""
+    return _start_of_day(day), _start_of_day(day + timedelta(days=1))
+
+
+def month_range(year, month):
+    """Return the (start, end) datetimes covering a calendar month."""
+    start = date(year, month, 1)
+    end = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+    return _start_of_day(start), _start_of_day(end)
@@ -4,9 +4,14 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.exceptions import NotFound, ValidationError
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Count, Sum
+from django.db import transaction
+from django.db.models import (
+    Case, Count, DecimalField, F, IntegerField, OuterRef, Q, Subquery, Sum, Value, When
+)
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
+from .broadcast import broadcast
 from .models import Order, Shift
 from .serializers import (
     OrderSerializer,
@@ -15,17 +20,50 @@ from .serializers import (
     ShiftSerializer
 )
 from .permissions import IsManager, CanUpdateOrder, CanDeleteOrder
+from .utils import month_range
 
 
 class ShiftViewSet(viewsets.ModelViewSet):
     """ViewSet for managing work shifts"""
-    queryset = Shift.objects.all().order_by('-opened_at')  # Newest first
+    queryset = Shift.objects.select_related('opened_by', 'closed_by').order_by('-opened_at')  # Newest first
     serializer_class = ShiftSerializer
     permission_classes = [IsAuthenticated, IsManager]
     http_method_names = ['get', 'post']
     ordering_fields = ['opened_at', 'closed_at']
     ordering = ['-opened_at']
     
+    def get_queryset(self):
+        """
+        When listing, annotate each shift with its delivered-order stats
+        (live for the active shift, stored for closed ones) in the same query.
+        """
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            delivered = Order.objects.filter(
+                status='DELIVERED',
+                delivered_at__gte=OuterRef('opened_at')
+            ).order_by().values('status')
+            queryset = queryset.annotate(
+                live_orders_delivered=Case(
+                    When(is_active=True, then=Coalesce(
+                        Subquery(delivered.annotate(count=Count('pk')).values('count')),
+                        0
+                    )),
+                    default=F('total_orders_delivered'),
+                    output_field=IntegerField()
+                ),
+                live_revenue=Case(
+                    When(is_active=True, then=Coalesce(
+                        Subquery(delivered.annotate(total=Sum('price')).values('total')),
+                        Value(0),
+                        output_field=DecimalField()
+                    )),
+                    default=F('total_revenue'),
+                    output_field=DecimalField()
+                ),
+            )
+        return queryset
+    
     @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated])
     def current(self, request):
         """Get current active shift"""
@@ -38,9 +76,8 @@ class ShiftViewSet(viewsets.ModelViewSet):
     def open_new(self, request):
         """Open a new shift"""
         # Close any active shifts first
-        active_shifts = Shift.objects.filter(is_active=True)
-        for shift in active_shifts:
-            self._close_shift(shift, request.user)
+        active_shifts = Shift.objects.filter(is_active=True).select_related('opened_by')
+        self._close_shifts(list(active_shifts), request.user)
         
         # Create new shift with explicit zero values
         shift = Shift.objects.create(
@@ -72,26 +109,55 @@ class ShiftViewSet(viewsets.ModelViewSet):
     
     def _close_shift(self, shift, user):
         """Helper to close shift and calculate delivered orders/revenue"""
-        shift.closed_at = timezone.now()
-        shift.closed_by = user
-        shift.is_active = False
+        self._close_shifts([shift], user)
+    
+    def _close_shifts(self, shifts, user):
+        """
+        Close shifts and calculate their delivered orders/revenue.
+        Stats for every shift come from a single aggregate query.
+        """
+        if not shifts:
+            return
         
-        # Get delivered orders in this shift timeframe
+        now = timezone.now()
+        oldest = min(shifts, key=lambda shift: shift.opened_at)
+        
+        # Get delivered orders in the combined timeframe of the shifts
         delivered_orders = Order.objects.filter(
             status='DELIVERED',
-            delivered_at__gte=shift.opened_at,
-            delivered_at__lte=shift.closed_at
+            delivered_at__gte=oldest.opened_at,
+            delivered_at__lte=now
         )
         
-        # Calculate stats
-        shift.total_orders_delivered = delivered_orders.count()
-        total_rev = delivered_orders.aggregate(Sum('price'))['price__sum']
-        shift.total_revenue = total_rev if total_rev else 0
+        # Per-shift stats in one query
+        aggregates = {}
+        for shift in shifts:
+            in_shift = Q(delivered_at__gte=shift.opened_at)
+            aggregates[f'count_{shift.pk}'] = Count('id', filter=in_shift)
+            aggregates[f'revenue_{shift.pk}'] = Sum('price', filter=in_shift)
+        stats = delivered_orders.aggregate(**aggregates)
         
-        # Link orders to this shift
-        delivered_orders.update(delivered_in_shift=shift)
+        for shift in shifts:
+            shift.closed_at = now
+            shift.closed_by = user
+            shift.is_active = False
+            shift.total_orders_delivered = stats[f'count_{shift.pk}']
+            shift.total_revenue = stats[f'revenue_{shift.pk}'] or 0
         
-        shift.save()
+        with transaction.atomic():
+            # Link orders to the oldest shift, which covers the whole timeframe
+            # (same result as closing the shifts newest first)
+            delivered_orders.update(delivered_in_shift=oldest)
+            Shift.objects.bulk_update(shifts, [
+                'closed_at', 'closed_by', 'is_active',
+                'total_orders_delivered', 'total_revenue'
+            ])
+            
+            # bulk_update skips post_save, so broadcast the closed shifts here
+            for shift in shifts:
+                transaction.on_commit(
+                    lambda shift=shift: broadcast('shift_update', 'updated', 'shift', ShiftSerializer(shift).data)
+                )
     
     @action(detail=True, methods=['get'])
     def delivered_orders(self, request, pk=None):
@@ -113,7 +179,7 @@ class ShiftViewSet(viewsets.ModelViewSet):
                 delivered_at__lte=shift.closed_at
             )
         
-        serializer = OrderSerializer(orders, many=True)
+        serializer = OrderSerializer(orders.select_related('created_by'), many=True)
         return Response(serializer.data)
 
 
@@ -126,7 +192,7 @@ class OrderViewSet(viewsets.ModelViewSet):
     - Update: Managers (all fields), Workers (status only)
     - Delete: Managers only
     """
-    queryset = Order.objects.all()
+    queryset = Order.objects.select_related('created_by')
     serializer_class = OrderSerializer
     permission_classes = [IsAuthenticated, CanUpdateOrder, CanDeleteOrder]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
@@ -135,6 +201,17 @@ class OrderViewSet(viewsets.ModelViewSet):
     ordering_fields = ['created_at', 'updated_at', 'price', 'delivered_at']
     ordering = ['-created_at']
     
+    def get_queryset(self):
+        """Load only the columns OrderSerializer renders when listing"""
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            queryset = queryset.only(
+                'id', 'customer_name', 'customer_phone', 'order_details', 'image',
+                'price', 'status', 'created_by', 'created_by__username',
+                'created_at', 'updated_at', 'delivered_at'
+            )
+        return queryset
+    
     def get_serializer_class(self):
         """Return appropriate serializer based on action"""
         if self.action == 'create':
@@ -168,17 +245,33 @@ class OrderViewSet(viewsets.ModelViewSet):
         Get order statistics (Manager only).
         Returns counts by status.
         """
+        # Total, per-status and monthly counts in one query
+        aggregates = {'total': Count('id')}
+        for status_code, _ in Order.STATUS_CHOICES:
+            aggregates[status_code] = Count('id', filter=Q(status=status_code))
+        
+        month = request.query_params.get('month')
+        year = request.query_params.get('year')
+        if month and year:
+            try:
+                start, end = month_range(int(year), int(month))
+            except ValueError:
+                raise ValidationError('Invalid year or month')
+            aggregates['delivered_this_month'] = Count('id', filter=Q(
+                delivered_at__gte=start,
+                delivered_at__lt=end
+            ))
+        
+        counts = Order.objects.aggregate(**aggregates)
         stats = {
-            'total': Order.objects.count(),
-            'by_status': dict(
-                Order.objects.values('status')
-                .annotate(count=Count('id'))
-                .values_list('status', 'count')),
-            'delivered_this_month': Order.objects.filter(
-                delivered_at__month=request.query_params.get('month'),
-                delivered_at__year=request.query_params.get('year')
-            ).count() if request.query_params.get('month') and request.query_params.get('year')
-            else None
+            'total': counts['total'],
+            # Only statuses that have orders, as before
+            'by_status': {
+                status_code: counts[status_code]
+                for status_code, _ in Order.STATUS_CHOICES
+                if counts[status_code]
+            },
+            'delivered_this_month': counts.get('delivered_this_month')
         }
         
         return Response(stats)
@@ -2,10 +2,12 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.db.models import Sum, Count, Q
+from django.db.models.functions import TruncDay
 from datetime import datetime, date
 from orders.models import Order
 from orders.serializers import OrderSerializer
 from orders.permissions import IsManager
+from orders.utils import day_range, month_range
 
 
 class DailyReportView(APIView):
@@ -15,6 +17,7 @@ class DailyReportView(APIView):
     
     Query params:
     - date: YYYY-MM-DD format (defaults to today)
+    - include_orders: 'true' to also return the delivered orders
     """
     permission_classes = [IsAuthenticated, IsManager]
     
@@ -32,42 +35,48 @@ class DailyReportView(APIView):
         else:
             report_date = date.today()
         
+        day_start, day_end = day_range(report_date)
+        
         # 1. Financials: Based on DELIVERED orders on this date
         delivered_orders = Order.objects.filter(
             status='DELIVERED',
-            delivered_at__date=report_date
+            delivered_at__gte=day_start,
+            delivered_at__lt=day_end
         )
         
-        total_delivered_count = delivered_orders.count()
-        total_revenue = delivered_orders.aggregate(total=Sum('price'))['total'] or 0
+        totals = delivered_orders.aggregate(count=Count('id'), revenue=Sum('price'))
+        total_delivered_count = totals['count']
+        total_revenue = totals['revenue'] or 0
         
         # 2. Operations: Based on CREATED orders on this date
         # This shows the current status of all orders that originated on this day
         created_orders = Order.objects.filter(
-            created_at__date=report_date
+            created_at__gte=day_start,
+            created_at__lt=day_end
         )
         
-        # Calculate status breakdown
+        # Calculate status breakdown, with 0 for statuses that have no orders
         status_counts = created_orders.values('status').annotate(count=Count('id'))
-        orders_by_status = {item['status']: item['count'] for item in status_counts}
-        
-        # Ensure all statuses are present with 0 if not found
-        for status, _ in Order.STATUS_CHOICES:
-            if status not in orders_by_status:
-                orders_by_status[status] = 0
+        orders_by_status = dict.fromkeys((status for status, _ in Order.STATUS_CHOICES), 0)
+        orders_by_status.update((item['status'], item['count']) for item in status_counts)
 
-        # Serialize delivered orders for detailed view if needed
-        # (Though UI mainly uses aggregates)
-        order_data = OrderSerializer(delivered_orders, many=True).data
-        
-        return Response({
+        report = {
             'date': report_date,
             'total_orders': total_delivered_count,
             'total_revenue': float(total_revenue),
             'average_order_value': float(total_revenue / total_delivered_count) if total_delivered_count > 0 else 0,
             'orders_by_status': orders_by_status,
-            'orders': order_data
-        })
+        }
+        
+        # Serialize delivered orders only when asked for
+        # (UI mainly uses aggregates)
+        if request.query_params.get('include_orders') == 'true':
+            report['orders'] = OrderSerializer(
+                delivered_orders.select_related('created_by'),
+                many=True
+            ).data
+        
+        return Response(report)
 
 
 class MonthlyReportView(APIView):
@@ -92,6 +101,8 @@ class MonthlyReportView(APIView):
                     {'error': 'Month must be between 1 and 12'},
                     status=400
                 )
+            
+            month_start, month_end = month_range(year, month)
         except ValueError:
             return Response(
                 {'error': 'Invalid year or month format'},
@@ -101,46 +112,41 @@ class MonthlyReportView(APIView):
         # 1. Financials: Based on DELIVERED orders in this month
         delivered_orders = Order.objects.filter(
             status='DELIVERED',
-            delivered_at__year=year,
-            delivered_at__month=month
+            delivered_at__gte=month_start,
+            delivered_at__lt=month_end
         )
         
-        total_delivered_count = delivered_orders.count()
-        total_revenue = delivered_orders.aggregate(total=Sum('price'))['total'] or 0
+        totals = delivered_orders.aggregate(count=Count('id'), revenue=Sum('price'))
+        total_delivered_count = totals['count']
+        total_revenue = totals['revenue'] or 0
         
         # 2. Operations: Based on CREATED orders in this month
         created_orders = Order.objects.filter(
-            created_at__year=year,
-            created_at__month=month
+            created_at__gte=month_start,
+            created_at__lt=month_end
         )
         
-        # Calculate status breakdown
+        # Calculate status breakdown, with 0 for statuses that have no orders
         status_counts = created_orders.values('status').annotate(count=Count('id'))
-        orders_by_status = {item['status']: item['count'] for item in status_counts}
-        
-        # Ensure all statuses are present
-        for status, _ in Order.STATUS_CHOICES:
-            if status not in orders_by_status:
-                orders_by_status[status] = 0
+        orders_by_status = dict.fromkeys((status for status, _ in Order.STATUS_CHOICES), 0)
+        orders_by_status.update((item['status'], item['count']) for item in status_counts)
         
         # 3. Daily Breakdown (Financials)
-        # Shows revenue trend over the month
-        daily_breakdown = {}
-        for order in delivered_orders:
-            day = order.delivered_at.day
-            if day not in daily_breakdown:
-                daily_breakdown[day] = {'count': 0, 'revenue': 0}
-            daily_breakdown[day]['count'] += 1
-            daily_breakdown[day]['revenue'] += float(order.price) if order.price else 0
-        
-        # Convert to list format
+        # Shows revenue trend over the month, grouped per day in the database
+        daily_totals = (
+            delivered_orders
+            .annotate(day=TruncDay('delivered_at'))
+            .values('day')
+            .annotate(count=Count('id'), revenue=Sum('price'))
+            .order_by('day')
+        )
         daily_data = [
             {
-                'day': day,
-                'count': data['count'],
-                'revenue': data['revenue']
+                'day': item['day'].day,
+                'count': item['count'],
+                'revenue': float(item['revenue'] or 0)
             }
-            for day, data in sorted(daily_breakdown.items())
+            for item in daily_totals
         ]
         
         return Response({
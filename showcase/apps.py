@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class ShowcaseConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'showcase'
+    
+    def ready(self):
+        """Import signals when app is ready"""
+        import showcase.signals
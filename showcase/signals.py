@@ -0,0 +1,19 @@
+"""
+Django signals for invalidating the cached showcase when delivered orders change.
+"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from orders.models import Order
+from laser_workshop.cache import bump_version_on_commit
+from .views import SHOWCASE_CACHE_PREFIX
+
+
+@receiver(post_save, sender=Order)
+@receiver(post_delete, sender=Order)
+def delivered_order_changed(sender, instance, **kwargs):
+    """
+    Bump the showcase cache version when a delivered order changes,
+    or when an order moves out of DELIVERED.
+    """
+    if instance.status == 'DELIVERED' or getattr(instance, 'left_delivered', False):
+        bump_version_on_commit(SHOWCASE_CACHE_PREFIX)
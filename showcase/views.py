@@ -1,23 +1,45 @@
+from django.core.cache import cache
 from rest_framework import generics
 from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from laser_workshop.cache import cache_key
 from orders.models import Order
 from orders.serializers import OrderShowcaseSerializer
 
+# Pages also expire on their own
+SHOWCASE_CACHE_TIMEOUT = 60
+# Cache key prefix, bumped by showcase.signals when delivered orders change
+SHOWCASE_CACHE_PREFIX = 'showcase'
+# Query params the showcase pages depend on
+SHOWCASE_CACHE_PARAMS = ('page', 'with_image', 'ordering')
+
 
 class ShowcaseListView(generics.ListAPIView):
     """
     Public API endpoint for showcase.
     Returns only delivered orders to display finished work.
-    No authentication required.
+    No authentication required. Pages are cached per page, with_image and ordering.
     """
     permission_classes = [AllowAny]
     serializer_class = OrderShowcaseSerializer
-    queryset = Order.objects.filter(status='DELIVERED').order_by('-delivered_at')
+    queryset = Order.objects.filter(status='DELIVERED').only(
+        'id', 'customer_name', 'image', 'order_details', 'delivered_at'
+    ).order_by('-delivered_at')
     
     def get_queryset(self):
         """Only return orders with images for better showcase"""
         queryset = super().get_queryset()
         # Optionally filter to only show orders with images
+        # (image__gt='' skips both empty and NULL images, and matches showcase_idx)
         if self.request.query_params.get('with_image', 'false').lower() == 'true':
-            queryset = queryset.exclude(image='')
+            queryset = queryset.filter(image__gt='')
         return queryset
+    
+    def list(self, request, *args, **kwargs):
+        build = super().list
+        data = cache.get_or_set(
+            cache_key(SHOWCASE_CACHE_PREFIX, request, SHOWCASE_CACHE_PARAMS),
+            lambda: build(request, *args, **kwargs).data,
+            SHOWCASE_CACHE_TIMEOUT
+        )
+        return Response(data)